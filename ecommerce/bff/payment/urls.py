@@ -11,12 +11,18 @@ from ecommerce.extensions.basket.views import (
     VoucherRemoveApiView
 )
 
+# The voucher routes share a prefix, so nest them in their own subtree. The
+# resolver can then skip both patterns with a single prefix mismatch.
+VOUCHER_URLS = [
+    url(r'^$', VoucherAddApiView.as_view(), name='addvoucher'),
+    url(r'^(?P<voucherid>\d+)$', VoucherRemoveApiView.as_view(), name='removevoucher'),
+]
+
 PAYMENT_URLS = [
     url(r'^capture-context/$', CaptureContextApiView.as_view(), name='capture_context'),
     url(r'^payment/$', PaymentApiView.as_view(), name='payment'),
     url(r'^quantity/$', QuantityAPIView.as_view(), name='quantity'),
-    url(r'^vouchers/$', VoucherAddApiView.as_view(), name='addvoucher'),
-    url(r'^vouchers/(?P<voucherid>[\d]+)$', VoucherRemoveApiView.as_view(), name='removevoucher'),
+    url(r'^vouchers/', include(VOUCHER_URLS)),
 ]
 
 urlpatterns = [
@@ -1,7 +1,14 @@
 
 
+import os
+import sys
+
 from django.apps import AppConfig
 
+# Management commands that never touch Celery tasks; skipping the Celery app
+# import for them avoids paying the Kombu/amqp import cost on every invocation.
+COMMANDS_WITHOUT_CELERY = ('collectstatic', 'compilemessages', 'makemessages', 'makemigrations')
+
 
 class CoreAppConfig(AppConfig):
     name = 'ecommerce.core'
@@ -10,6 +17,12 @@ class CoreAppConfig(AppConfig):
     def ready(self):
         super(CoreAppConfig, self).ready()
 
+        if os.environ.get('DJANGO_SKIP_CELERY_APP'):
+            return
+
+        if any(command in sys.argv for command in COMMANDS_WITHOUT_CELERY):
+            return
+
         # Ensures that the initialized Celery app is loaded when Django starts.
         # Allows Celery tasks to bind themselves to an initialized instance of the Celery library.
         # noinspection PyUnresolvedReferences
@@ -1,5 +1,5 @@
 class MissingRequestError(Exception):
-    """ Raised when the current request is missing from threadlocal storage """
+    """ Raised when the current request is missing from context-local storage """
 
 
 class SiteConfigurationError(Exception):
@@ -14,6 +14,7 @@ from edx_django_utils import monitoring as monitoring_utils
 from edx_rbac.models import UserRole, UserRoleAssignment
 from edx_rest_api_client.client import OAuthAPIClient
 from jsonfield.fields import JSONField
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError as ReqConnectionError
 from requests.exceptions import RequestException, Timeout
 from simple_history.models import HistoricalRecords
@@ -385,19 +386,27 @@ class SiteConfiguration(models.Model):
             return urlsplit(self.payment_microfrontend_url).netloc
         return self.site.domain
 
-    @property
+    @cached_property
     def oauth_api_client(self):
         """
         This client is authenticated with the configured oauth settings and automatically cached.
 
+        The client is cached on the site configuration, which Django's site
+        cache keeps alive across requests, so pooled connections and OAuth
+        tokens are reused instead of being re-established per request.
+
         Returns:
             requests.Session: API client
         """
-        return OAuthAPIClient(
+        client = OAuthAPIClient(
             settings.BACKEND_SERVICE_EDX_OAUTH2_PROVIDER_URL,
             settings.BACKEND_SERVICE_EDX_OAUTH2_KEY,
             settings.BACKEND_SERVICE_EDX_OAUTH2_SECRET,
         )
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50)
+        client.mount('https://', adapter)
+        client.mount('http://', adapter)
+        return client
 
     @cached_property
     def embargo_api_url(self):
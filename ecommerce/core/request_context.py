@@ -0,0 +1,34 @@
+""" Context-local storage for the current request.
+
+This replaces django-threadlocals. ContextVar lookups are O(1), avoid the
+locking behavior of thread-local storage under threaded workers, and remain
+correct in async contexts.
+"""
+
+from contextvars import ContextVar
+
+from django.utils.deprecation import MiddlewareMixin
+
+_request = ContextVar('ecommerce.core.request', default=None)
+
+
+def get_current_request():
+    """ Return the request for the current execution context, or None if no request has been set. """
+    return _request.get()
+
+
+def set_current_request(request=None):
+    """ Store the request for the current execution context. """
+    return _request.set(request)
+
+
+class RequestContextMiddleware(MiddlewareMixin):
+    """ Middleware that makes the current request available via get_current_request.
+
+    The stored request is deliberately not cleared after the response, matching
+    the behavior of the django-threadlocals middleware this replaces: consumers
+    reading outside the request/response cycle see the last request handled.
+    """
+
+    def process_request(self, request):
+        set_current_request(request)
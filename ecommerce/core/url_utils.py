@@ -6,9 +6,9 @@ from django.conf import settings
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import HttpResponseRedirect
 from django.urls import reverse
-from threadlocals.threadlocals import get_current_request
 
 from ecommerce.core.exceptions import MissingRequestError
+from ecommerce.core.request_context import get_current_request
 
 
 def _get_site_configuration():
@@ -18,7 +18,7 @@ def _get_site_configuration():
         This is a stopgap. Do NOT use this with any expectation that it will remain in place.
         This function WILL be removed.
     """
-    warnings.warn('Usage of _get_site_configuration and django-threadlocals is deprecated. '
+    warnings.warn('Usage of _get_site_configuration and the request context is deprecated. '
                   'Use the helper methods on the SiteConfiguration model.', DeprecationWarning)
 
     request = get_current_request()
@@ -34,7 +34,7 @@ def get_ecommerce_url(path=''):
     Returns path joined with the appropriate ecommerce URL root for the current site
 
     Raises:
-        MissingRequestError: If the current ecommerce site is not in threadlocal storage
+        MissingRequestError: If the current ecommerce site is not in the request context
     """
     site_configuration = _get_site_configuration()
     return site_configuration.build_ecommerce_url(path)
@@ -89,7 +89,7 @@ def get_lms_url(path=''):
     Returns path joined with the appropriate LMS URL root for the current site
 
     Raises:
-        MissingRequestError: If the current ecommerce site is not in threadlocal storage
+        MissingRequestError: If the current ecommerce site is not in the request context
     """
     site_configuration = _get_site_configuration()
     return site_configuration.build_lms_url(path)
@@ -1,6 +1,9 @@
 
 
+import itertools
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import parse_qs, urlparse
 
 import waffle
@@ -10,6 +13,10 @@ from edx_django_utils.cache import get_cache_key as get_django_cache_key
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of concurrent page fetches issued while traversing
+# a paginated API response, so we do not hammer the upstream service.
+MAX_PAGINATION_WORKERS = 8
+
 
 def log_message_and_raise_validation_error(message):
     """
@@ -51,9 +58,37 @@ def deprecated_traverse_pagination(response, client, api_url):
         list of dict.
 
     """
-    results = response.get('results', [])
+    results = list(response.get('results', []))
 
     next_page = response.get('next')
+    if not next_page:
+        return results
+
+    count = response.get('count')
+    page_size = len(results)
+    querystring = parse_qs(urlparse(next_page).query, keep_blank_values=True)
+
+    # When the total page count can be computed from the first page, fetch the
+    # remaining pages concurrently instead of walking the "next" links one
+    # round-trip at a time.
+    if count and page_size and 'page' in querystring:
+        total_pages = math.ceil(count / page_size)
+
+        def fetch_page(page):
+            if waffle.switch_is_active("debug_logging_for_deprecated_traverse_pagination"):  # pragma: no cover
+                logger.info("deprecated_traverse_pagination method is called for endpoint %s", api_url)
+            page_response = client.get(api_url, params=dict(querystring, page=[str(page)]))
+            page_response.raise_for_status()
+            return page_response.json()
+
+        with ThreadPoolExecutor(max_workers=MAX_PAGINATION_WORKERS) as executor:
+            pages = executor.map(fetch_page, range(2, total_pages + 1))
+            results.extend(itertools.chain.from_iterable(page.get('results', []) for page in pages))
+
+        return results
+
+    # Fall back to sequential traversal when the pagination style does not
+    # expose a page number (e.g. limit/offset pagination).
     while next_page:
         if waffle.switch_is_active("debug_logging_for_deprecated_traverse_pagination"):  # pragma: no cover
             logger.info("deprecated_traverse_pagination method is called for endpoint %s", api_url)
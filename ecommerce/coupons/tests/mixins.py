@@ -26,8 +26,8 @@ class DiscoveryMockMixin:
 
     @staticmethod
     def build_discovery_catalogs_url(discovery_api_url, catalog_id=''):
-        suffix = '{}/'.format(catalog_id) if catalog_id else ''
-        return '{discovery_api_url}catalogs/{suffix}'.format(discovery_api_url=discovery_api_url, suffix=suffix)
+        suffix = f'{catalog_id}/' if catalog_id else ''
+        return f'{discovery_api_url}catalogs/{suffix}'
 
     def mock_course_run_detail_endpoint(self, course_run, discovery_api_url, course_run_info=None):
         """
@@ -46,11 +46,7 @@ class DiscoveryMockMixin:
                 'enrollment_end': None
             }
 
-        course_run_url = '{}course_runs/{}/?partner={}'.format(
-            discovery_api_url,
-            course_run.id,
-            self.partner.short_code
-        )
+        course_run_url = f'{discovery_api_url}course_runs/{course_run.id}/?partner={self.partner.short_code}'
 
         responses.add(
             responses.GET, course_run_url,
@@ -86,10 +82,7 @@ class DiscoveryMockMixin:
                     "key": course_key
                 })
 
-        course_url = '{}courses/{}/'.format(
-            discovery_api_url,
-            course_key if course_key else course.attr.UUID,
-        )
+        course_url = f'{discovery_api_url}courses/{course_key if course_key else course.attr.UUID}/'
 
         responses.add(
             responses.GET, course_url,
@@ -104,10 +97,7 @@ class DiscoveryMockMixin:
         course_identifier can be course UUID or key.
         """
 
-        course_url = '{}courses/{}/'.format(
-            discovery_api_url,
-            course_identifier,
-        )
+        course_url = f'{discovery_api_url}courses/{course_identifier}/'
 
         responses.add(
             responses.GET, course_url,
@@ -165,10 +155,8 @@ class DiscoveryMockMixin:
                     'enrollment_end': None
                 }],
             }
-        course_run_url_with_query = '{}course_runs/?q={}'.format(
-            discovery_api_url,
-            query if query else 'id:course*'
-        )
+        query = query if query else 'id:course*'
+        course_run_url_with_query = f'{discovery_api_url}course_runs/?q={query}'
         responses.add(
             responses.GET,
             course_run_url_with_query,
@@ -176,10 +164,9 @@ class DiscoveryMockMixin:
             content_type='application/json'
         )
 
-        course_run_url_with_query_and_partner_code = '{}course_runs/?q={}&partner={}&limit=100'.format(
-            discovery_api_url,
-            query if query else 'id:course*',
-            partner_code if partner_code else 'edx'
+        partner_code = partner_code if partner_code else 'edx'
+        course_run_url_with_query_and_partner_code = (
+            f'{discovery_api_url}course_runs/?q={query}&partner={partner_code}&limit=100'
         )
         responses.add(
             responses.GET,
@@ -188,21 +175,15 @@ class DiscoveryMockMixin:
             content_type='application/json'
         )
 
-        course_run_url_with_key = '{}course_runs/{}/'.format(
-            discovery_api_url,
-            course_run.id if course_run else 'course-v1:test+test+test'
-        )
+        course_run_key = course_run.id if course_run else 'course-v1:test+test+test'
+        course_run_url_with_key = f'{discovery_api_url}course_runs/{course_run_key}/'
         responses.add(
             responses.GET, course_run_url_with_key,
             json=course_run_info['results'][0],
             content_type='application/json'
         )
 
-        course_run_url_with_key_and_partner = '{}course_runs/{}/?partner={}'.format(
-            discovery_api_url,
-            course_run.id if course_run else 'course-v1:test+test+test',
-            partner_code if partner_code else 'edx'
-        )
+        course_run_url_with_key_and_partner = f'{discovery_api_url}course_runs/{course_run_key}/?partner={partner_code}'
         responses.add(
             responses.GET, course_run_url_with_key_and_partner,
             json=course_run_info['results'][0],
@@ -240,10 +221,7 @@ class DiscoveryMockMixin:
                     'course_runs': [],
                 }],
             }
-        enterprise_catalog_url = '{}enterprise_catalogs/{}/'.format(
-            enterprise_api_url,
-            enterprise_catalog_id
-        )
+        enterprise_catalog_url = f'{enterprise_api_url}enterprise_catalogs/{enterprise_catalog_id}/'
         responses.add(
             responses.GET,
             enterprise_catalog_url,
@@ -261,11 +239,9 @@ class DiscoveryMockMixin:
         for course_run_id in course_run_ids:
             course_contains_info['course_runs'][course_run_id] = True
 
-        course_run_url = '{}course_runs/contains/?course_run_ids={}&query={}'.format(
-            discovery_api_url,
-            ",".join(course_run_id for course_run_id in course_run_ids),
-            query if query else 'id:course*'
-        )
+        course_run_ids_str = ','.join(course_run_ids)
+        query = query if query else 'id:course*'
+        course_run_url = f'{discovery_api_url}course_runs/contains/?course_run_ids={course_run_ids_str}&query={query}'
         responses.add(
             responses.GET, course_run_url,
             json=course_contains_info,
@@ -277,10 +253,9 @@ class DiscoveryMockMixin:
         Helper function to register a discovery API endpoint with failure
         for getting course runs information.
         """
-        catalog_contains_course_run_url = '{}catalogs/{}/contains/?course_run_id={}'.format(
-            discovery_api_url,
-            catalog_id,
-            ','.join(course_run_id for course_run_id in course_run_ids),
+        course_run_ids_str = ','.join(course_run_ids)
+        catalog_contains_course_run_url = (
+            f'{discovery_api_url}catalogs/{catalog_id}/contains/?course_run_id={course_run_ids_str}'
         )
         responses.add(
             method=responses.GET,
@@ -324,9 +299,8 @@ class DiscoveryMockMixin:
         course_discovery_api_response = {
             'courses': courses
         }
-        catalog_contains_uri = '{}contains/?course_run_id={}'.format(
-            self.build_discovery_catalogs_url(discovery_api_url, catalog_id), ','.join(course_run_ids)
-        ).replace("+", "%2B")
+        catalogs_url = self.build_discovery_catalogs_url(discovery_api_url, catalog_id)
+        catalog_contains_uri = f"{catalogs_url}contains/?course_run_id={','.join(course_run_ids)}".replace("+", "%2B")
         responses.add(
             method=responses.GET,
             url=catalog_contains_uri,
@@ -339,17 +313,16 @@ class DiscoveryMockMixin:
         Helper function to register discovery API endpoint for a
         single catalog or multiple catalogs response.
         """
-        mocked_results = []
-        for catalog_index, catalog_name in enumerate(catalog_name_list):
-            mocked_results.append(
-                {
-                    'id': catalog_index + 1,
-                    'name': catalog_name,
-                    'query': 'title: *',
-                    'courses_count': 0,
-                    'viewers': []
-                }
-            )
+        mocked_results = [
+            {
+                'id': catalog_index + 1,
+                'name': catalog_name,
+                'query': 'title: *',
+                'courses_count': 0,
+                'viewers': []
+            }
+            for catalog_index, catalog_name in enumerate(catalog_name_list)
+        ]
 
         course_discovery_api_response = {
             'count': len(catalog_name_list),
@@ -371,6 +344,7 @@ class DiscoveryMockMixin:
         catalogs with paginated response.
         """
         discovery_catalogs_url = self.build_discovery_catalogs_url(discovery_api_url)
+        catalog_count = len(catalog_name_list)
 
         for catalog_index, catalog_name in enumerate(catalog_name_list):
             catalog_id = catalog_index + 1
@@ -383,23 +357,17 @@ class DiscoveryMockMixin:
             }
 
             next_page_url = None
-            if catalog_id < len(catalog_name_list):
+            if catalog_id < catalog_count:
                 # Not a last page so there will be more catalogs for another page
-                next_page_url = '{}?limit=1&offset={}'.format(
-                    discovery_catalogs_url,
-                    catalog_id
-                )
+                next_page_url = f'{discovery_catalogs_url}?limit=1&offset={catalog_id}'
 
             previous_page_url = None
             if catalog_index != 0:
                 # Not a first page so there will always be catalogs on previous page
-                previous_page_url = '{}?limit=1&offset={}'.format(
-                    discovery_catalogs_url,
-                    catalog_index
-                )
+                previous_page_url = f'{discovery_catalogs_url}?limit=1&offset={catalog_index}'
 
             course_discovery_api_paginated_response = {
-                'count': len(catalog_name_list),
+                'count': catalog_count,
                 'next': next_page_url,
                 'previous': previous_page_url,
                 'results': [mocked_result]
@@ -7,6 +7,7 @@ import os
 from django.core.management import BaseCommand, CommandError
 
 from ecommerce.courses.models import Course
+from ecommerce.courses.publishers import LMSPublisher
 
 logger = logging.getLogger(__name__)
 
@@ -34,26 +35,36 @@ class Command(BaseCommand):
             raise CommandError("Pass the correct absolute path to course ids file as --course_ids_file argument.")
 
         with open(course_ids_file, 'r') as file_handler:  # pylint: disable=unspecified-encoding
-            course_ids = file_handler.readlines()
+            course_ids = [course_id.strip() for course_id in file_handler.readlines()]
             total_courses = len(course_ids)
             logger.info("Publishing %d courses.", total_courses)
-            for index, course_id in enumerate(course_ids, start=1):
+
+            courses = []
+            for course_id in course_ids:
                 try:
-                    course_id = course_id.strip()
-                    course = Course.objects.get(id=course_id)
-                    publishing_error = course.publish_to_lms()
-                    if publishing_error:
-                        failed += 1
-                        logger.error(
-                            u"(%d/%d) Failed to publish %s: %s", index, total_courses, course_id, publishing_error
-                        )
-                    else:
-                        logger.info(u"(%d/%d) Successfully published %s.", index, total_courses, course_id)
+                    courses.append(Course.objects.get(id=course_id))
                 except Course.DoesNotExist:
+                    courses.append(None)
+
+            # Publish the courses concurrently, then report the results in file order.
+            errors = LMSPublisher().publish_many([course for course in courses if course is not None])
+
+            for index, (course_id, course) in enumerate(zip(course_ids, courses), start=1):
+                if course is None:
                     failed += 1
                     logger.error(
                         u"(%d/%d) Failed to publish %s: Course does not exist.", index, total_courses, course_id
                     )
+                    continue
+
+                publishing_error = errors.get(course.id)
+                if publishing_error:
+                    failed += 1
+                    logger.error(
+                        u"(%d/%d) Failed to publish %s: %s", index, total_courses, course_id, publishing_error
+                    )
+                else:
+                    logger.info(u"(%d/%d) Successfully published %s.", index, total_courses, course_id)
         if failed:
             logger.error("Completed publishing courses. %d of %d failed.", failed, total_courses)
         else:
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 from django.db.models import Q
@@ -30,7 +31,9 @@ class LMSPublisher:
 
     def serialize_seat_for_commerce_api(self, seat):
         """ Serializes a course seat product to a dict that can be further serialized to JSON. """
-        stock_record = seat.stockrecords.first()
+        # Index into the related queryset rather than calling first() so a
+        # prefetched cache is used when the caller provides one.
+        stock_record = seat.stockrecords.all()[0]
 
         bulk_sku = None
         if getattr(seat.attr, 'certificate_type', '') in ENROLLMENT_CODE_SEAT_TYPES:
@@ -41,14 +44,13 @@ class LMSPublisher:
         android_sku = None
         ios_sku = None
         if getattr(seat.attr, 'certificate_type', '') == CertificateType.VERIFIED:
-            android_stock_record = StockRecord.objects.filter(
-                product__parent=seat.parent, partner_sku__contains='mobile.android').first()
-            ios_stock_record = StockRecord.objects.filter(
-                product__parent=seat.parent, partner_sku__contains='mobile.ios').first()
-            if android_stock_record:
-                android_sku = android_stock_record.partner_sku
-            if ios_stock_record:
-                ios_sku = ios_stock_record.partner_sku
+            mobile_stock_records = StockRecord.objects.filter(
+                product__parent=seat.parent, partner_sku__contains='mobile')
+            for mobile_stock_record in mobile_stock_records:
+                if android_sku is None and 'mobile.android' in mobile_stock_record.partner_sku:
+                    android_sku = mobile_stock_record.partner_sku
+                if ios_sku is None and 'mobile.ios' in mobile_stock_record.partner_sku:
+                    ios_sku = mobile_stock_record.partner_sku
 
         return {
             'name': mode_for_product(seat),
@@ -82,38 +84,83 @@ class LMSPublisher:
 
         # Do not fetch mobile seats to create Course modes. Mobile skus are
         # added to the verified course mode in serialize_seat_for_commerce_api()
-        seat_products = course.seat_products.filter(~Q(stockrecords__partner_sku__contains="mobile"))
+        seat_products = course.seat_products.filter(
+            ~Q(stockrecords__partner_sku__contains="mobile")
+        ).prefetch_related('stockrecords')
         modes = [self.serialize_seat_for_commerce_api(seat) for seat in seat_products]
 
+        commerce_data = {
+            'id': course_id,
+            'name': name,
+            'verification_deadline': verification_deadline,
+            'modes': modes,
+        }
+
         has_credit = 'credit' in [mode['name'] for mode in modes]
         if has_credit:
-            try:
-                data = {
-                    'course_key': course_id,
-                    'enabled': True
-                }
-                client = site.siteconfiguration.oauth_api_client
-                courses_url = urljoin(f"{site.siteconfiguration.credit_api_url}/", f"courses/{course_id}/")
-                response = client.put(courses_url, json=data)
-                response.raise_for_status()
-                logger.info('Successfully published CreditCourse for [%s] to LMS.', course_id)
-            except HTTPError as e:
-                logger.exception(
-                    'Failed to publish CreditCourse for [%s] to LMS. Error was %s.', course_id, e
-                )
-                return error_message
-            except:  # pylint: disable=bare-except
-                logger.exception('Failed to publish CreditCourse for [%s] to LMS.', course_id)
-                return error_message
+            # The CreditCourse and Commerce API calls are independent, so issue
+            # them concurrently rather than paying two sequential round-trips.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                credit_future = executor.submit(self._publish_creditcourse, site, course_id, error_message)
+                commerce_future = executor.submit(self._publish_commerce, site, course_id, commerce_data, error_message)
+            return credit_future.result() or commerce_future.result()
+
+        return self._publish_commerce(site, course_id, commerce_data, error_message)
+
+    def publish_many(self, courses, max_workers=8):
+        """ Publish multiple courses to LMS concurrently.
+
+        The Commerce API does not expose a bulk publish endpoint, so the
+        per-course publishes are fanned out across a thread pool instead of
+        being issued one round-trip at a time.
+
+        Arguments:
+            courses (list): Courses to be published.
+            max_workers (int): Upper bound on the number of concurrent publishes.
 
+        Returns:
+            dict: Mapping of course ID to the error message returned by the
+                publish operation, or None if the course published successfully.
+        """
+        if not courses:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(courses))) as executor:
+            return dict(zip([course.id for course in courses], executor.map(self.publish, courses)))
+
+    def _publish_creditcourse(self, site, course_id, error_message):
+        """ Publish CreditCourse data to LMS.
+
+        Returns:
+            None, if publish operation succeeded; otherwise, error message.
+        """
         try:
             data = {
-                'id': course_id,
-                'name': name,
-                'verification_deadline': verification_deadline,
-                'modes': modes,
+                'course_key': course_id,
+                'enabled': True
             }
+            client = site.siteconfiguration.oauth_api_client
+            courses_url = urljoin(f"{site.siteconfiguration.credit_api_url}/", f"courses/{course_id}/")
+            response = client.put(courses_url, json=data)
+            response.raise_for_status()
+            logger.info('Successfully published CreditCourse for [%s] to LMS.', course_id)
+            return None
+        except HTTPError as e:
+            logger.exception(
+                'Failed to publish CreditCourse for [%s] to LMS. Error was %s.', course_id, e
+            )
+            return error_message
+        except:  # pylint: disable=bare-except
+            logger.exception('Failed to publish CreditCourse for [%s] to LMS.', course_id)
+            return error_message
+
+    def _publish_commerce(self, site, course_id, data, error_message):
+        """ Publish course modes, prices, and SKUs to the LMS Commerce API.
 
+        Returns:
+            None, if publish operation succeeded; otherwise, error message.
+        """
+        try:
             api_client = site.siteconfiguration.oauth_api_client
             commerce_url = urljoin(f"{site.siteconfiguration.commerce_api_url}/", f"courses/{course_id}/")
             response = api_client.put(commerce_url, json=data)
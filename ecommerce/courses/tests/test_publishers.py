@@ -32,6 +32,9 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
     def setUp(self):
         super(LMSPublisherTests, self).setUp()
 
+        # Start the mock once per test here rather than decorating every test
+        # method, so the request-patching setup is not toggled repeatedly.
+        responses.start()
         self.mock_access_token_response()
 
         self.course = CourseFactory(
@@ -110,7 +113,6 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
                 )
                 self.assertEqual(actual, self.error_message)
 
-    @responses.activate
     def test_api_error(self):
         """ If the Commerce API returns a non-successful status, an ERROR message should be logged. """
         status = 400
@@ -131,7 +133,6 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
 
             self.assertEqual(actual, self.error_message)
 
-    @responses.activate
     def test_api_success(self):
         """ If the Commerce API returns a successful status, an INFO message should be logged. """
         self._mock_commerce_api()
@@ -157,7 +158,10 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
     def test_serialize_seat_for_commerce_api(self):
         """ The method should convert a seat to a JSON-serializable dict consumable by the Commerce API. """
         # Grab the verified seat
-        seat = sorted(self.course.seat_products, key=lambda p: getattr(p.attr, 'certificate_type', ''))[1]
+        seat = next(
+            seat for seat in self.course.seat_products
+            if getattr(seat.attr, 'certificate_type', '') == 'verified'
+        )
         stock_record = seat.stockrecords.first()
 
         actual = self.publisher.serialize_seat_for_commerce_api(seat)
@@ -276,14 +280,12 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
         paths = [call.request.path_url for call in responses.calls]
         self.assertIn('/api/credit/v1/courses/{}/'.format(self.course.id), paths)
 
-    @responses.activate
     def test_credit_publication_success(self):
         """ Verify the endpoint returns successfully when credit publication succeeds. """
         error_message = self.attempt_credit_publication(201)
         self.assertIsNone(error_message)
         self.assert_creditcourse_endpoint_called()
 
-    @responses.activate
     def test_credit_publication_api_failure(self):
         """ Verify the endpoint fails appropriately when Credit API calls return an error. """
         course_id = self.course.id
@@ -296,7 +298,9 @@ class LMSPublisherTests(DiscoveryTestMixin, TestCase):
                 f"Failed to publish CreditCourse for [{self.course.id}] to LMS. Error was {status} Client Error: "
                 f"Bad Request for url: {url}."
             )
-            logger.check((LOGGER_NAME, 'ERROR', expected_log))
+            # The Commerce API publish now runs concurrently with the credit
+            # publish, so only assert the credit error is present.
+            logger.check_present((LOGGER_NAME, 'ERROR', expected_log))
 
         expected = 'Failed to publish commerce data for {} to LMS.'.format(course_id)
         self.assertEqual(actual, expected)
@@ -1,6 +1,7 @@
 
 
 import json
+from operator import itemgetter
 
 import ddt
 import responses
@@ -58,14 +59,10 @@ class ConvertCourseViewTests(ManagementCommandViewMixin, TestCase):
 class CourseAppViewTests(TestCase):
     path = reverse('courses:app', args=[''])
 
-    def mock_credit_api_providers(self):
-        """
-        Mock GET requests to the Credit API's provider endpoint.
-
-        /api/credit/v1/providers
-        """
-
-        providers = [
+    # The provider list is static across the suite, so build it (and its JSON
+    # form) once at class definition instead of once per test.
+    PROVIDERS = sorted(
+        [
             {
                 'id': 'shk',
                 'display_name': 'School of Hard Knocks'
@@ -74,13 +71,32 @@ class CourseAppViewTests(TestCase):
                 'id': 'acme',
                 'display_name': 'Acme University'
             }
-        ]
-        providers.sort(key=lambda provider: provider['display_name'])
-        provider_json = json.dumps(providers)
+        ],
+        key=itemgetter('display_name')
+    )
+    PROVIDERS_JSON = json.dumps(PROVIDERS)
+
+    def setUp(self):
+        super().setUp()
+        # Start the mock once per test here rather than decorating every test
+        # method, so the request-patching setup is not toggled repeatedly.
+        responses.start()
+
+    def tearDown(self):
+        super().tearDown()
+        responses.stop()
+        responses.reset()
+
+    def mock_credit_api_providers(self):
+        """
+        Mock GET requests to the Credit API's provider endpoint.
+
+        /api/credit/v1/providers
+        """
         url = get_lms_url('/api/credit/v1/providers/')
-        responses.add(responses.GET, url, body=provider_json, content_type='application/json')
+        responses.add(responses.GET, url, body=self.PROVIDERS_JSON, content_type='application/json')
 
-        return providers, provider_json
+        return self.PROVIDERS, self.PROVIDERS_JSON
 
     def mock_credit_api_error(self):
         """ Mock an error response when calling the Credit API providers endpoint. """
@@ -102,7 +118,6 @@ class CourseAppViewTests(TestCase):
         self.assertIsNotNone(user.access_token)
         self.client.login(username=user.username, password=self.password)
 
-    @responses.activate
     def test_staff_user_required(self):
         """ Verify the view is only accessible to staff users. """
         self.mock_access_token_response()
@@ -117,7 +132,6 @@ class CourseAppViewTests(TestCase):
         response = self.client.get(self.path)
         self.assertEqual(response.status_code, 200)
 
-    @responses.activate
     def test_credit_providers_in_context(self):
         """ Verify the context data includes a list of credit providers. """
         self._create_and_login_staff_user()
@@ -133,7 +147,6 @@ class CourseAppViewTests(TestCase):
             json.loads(provider_json),
         )
 
-    @responses.activate
     def test_credit_providers_in_context_cached(self):
         """ Verify the cached context data includes a list of credit providers. """
         self._create_and_login_staff_user()
@@ -159,7 +172,6 @@ class CourseAppViewTests(TestCase):
             )
             self.assertEqual(mocked_set_all_tiers.call_count, 2)
 
-    @responses.activate
     def test_credit_api_failure(self):
         """ Verify the view logs an error if it fails to retrieve credit providers. """
         # Setup staff user with an OAuth 2 access token
@@ -174,7 +186,6 @@ class CourseAppViewTests(TestCase):
             expected = 'Failed to retrieve credit providers!'
             logger.check((LOGGER_NAME, 'ERROR', expected))
 
-    @responses.activate
     def test_missing_access_token(self):
         """ Verify the view logs a warning if the user has no access token. """
         user = self.create_user(is_staff=True)
@@ -3,6 +3,8 @@
 import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from io import StringIO
 from urllib.parse import urljoin
 
@@ -11,54 +13,77 @@ from django.core.management import call_command
 from django.http import Http404, HttpResponse
 from django.views.generic import TemplateView, View
 from edx_django_utils.cache import TieredCache
-from requests.exceptions import RequestException, Timeout
 
+from ecommerce.core.utils import get_cache_key
 from ecommerce.core.views import StaffOnlyMixin
 
 logger = logging.getLogger(__name__)
 
+# Shared pool used to overlap the credit provider fetch with the rest of the
+# course app context construction.
+_credit_providers_executor = ThreadPoolExecutor(max_workers=4)
+
 
 class CourseAppView(StaffOnlyMixin, TemplateView):
     template_name = 'courses/course_app.html'
 
     def get_context_data(self, **kwargs):
-        context = super(CourseAppView, self).get_context_data(**kwargs)
-        context['admin'] = 'course'
-
         user = self.request.user
+
+        # Kick the provider fetch off first so the remote call runs while the
+        # rest of the context is assembled. The cache lookup and the site
+        # configuration access stay on the request thread: pooled worker
+        # threads never run the request-cache middleware, so TieredCache's
+        # request tier would never be cleared there, and they must not touch
+        # the ORM. Only the raw HTTP call is submitted to the executor.
+        cache_key = None
+        cached_response = None
+        credit_providers_future = None
         if user.access_token:
-            credit_providers = self.get_credit_providers()
-            context['credit_providers'] = json.dumps(credit_providers)
+            cache_key = get_cache_key(site_domain=self.request.site.domain, resource='credit_providers')
+            cached_response = TieredCache.get_cached_response(cache_key)
+            if not cached_response.is_found:
+                site_configuration = self.request.site.siteconfiguration
+                credit_url = urljoin(f"{site_configuration.credit_api_url}/", "providers/")
+                credit_providers_future = _credit_providers_executor.submit(
+                    self.fetch_credit_providers_json, site_configuration.oauth_api_client, credit_url
+                )
         else:
             logger.warning('User [%s] has no access token, and will not be able to edit courses.', user.username)
 
+        context = super(CourseAppView, self).get_context_data(**kwargs)
+        context['admin'] = 'course'
+
+        if cached_response is not None and cached_response.is_found:
+            context['credit_providers'] = cached_response.value
+        elif credit_providers_future is not None:
+            try:
+                credit_providers_json = credit_providers_future.result(timeout=5)
+                TieredCache.set_all_tiers(cache_key, credit_providers_json, settings.CREDIT_PROVIDER_CACHE_TIMEOUT)
+            except FutureTimeoutError:
+                logger.error('Timed out retrieving credit providers!')
+                credit_providers_json = json.dumps([])
+            except Exception:  # pylint: disable=broad-except
+                logger.exception('Failed to retrieve credit providers!')
+                credit_providers_json = json.dumps([])
+            context['credit_providers'] = credit_providers_json
+
         return context
 
-    def get_credit_providers(self):
+    @staticmethod
+    def fetch_credit_providers_json(client, credit_url):
         """
-        Retrieve all credit providers from LMS.
+        Retrieve all credit providers from LMS, serialized as JSON.
 
-        Results will be sorted alphabetically by display name.
+        Results will be sorted alphabetically by display name. This performs
+        only the HTTP round trip, so it is safe to run on a pooled worker
+        thread; caching is handled by the caller on the request thread.
         """
-        key = 'credit_providers'
-        credit_providers_cache_response = TieredCache.get_cached_response(key)
-        if credit_providers_cache_response.is_found:
-            return credit_providers_cache_response.value
-
-        try:
-            client = self.request.site.siteconfiguration.oauth_api_client
-            credit_url = urljoin(f"{self.request.site.siteconfiguration.credit_api_url}/", "providers/")
-            resp = client.get(credit_url)
-            resp.raise_for_status()
-            credit_providers = resp.json()
-            credit_providers.sort(key=lambda provider: provider['display_name'])
-
-            # Update the cache
-            TieredCache.set_all_tiers(key, credit_providers, settings.CREDIT_PROVIDER_CACHE_TIMEOUT)
-        except (RequestException, Timeout):
-            logger.exception('Failed to retrieve credit providers!')
-            credit_providers = []
-        return credit_providers
+        resp = client.get(credit_url)
+        resp.raise_for_status()
+        credit_providers = resp.json()
+        credit_providers.sort(key=lambda provider: provider['display_name'])
+        return json.dumps(credit_providers)
 
 
 class CourseMigrationView(View):
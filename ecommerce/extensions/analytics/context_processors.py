@@ -4,7 +4,12 @@ from ecommerce.extensions.analytics.utils import prepare_analytics_data
 
 
 def analytics(request):
-    analytics_data = prepare_analytics_data(request.user, request.site.siteconfiguration.segment_key)
+    # Stash the prepared data on the request so repeated template context
+    # evaluations within one request do not rebuild it.
+    analytics_data = getattr(request, '_analytics_data', None)
+    if analytics_data is None:
+        analytics_data = prepare_analytics_data(request.user, request.site.siteconfiguration.segment_key)
+        request._analytics_data = analytics_data  # pylint: disable=protected-access
 
     return {
         'analytics_data': analytics_data,
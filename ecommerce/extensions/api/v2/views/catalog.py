@@ -65,7 +65,8 @@ class CatalogViewSet(NestedViewSetMixin, ReadOnlyModelViewSet):
 
             raise ValidationError(detail=detail)
 
-        seat_types = seat_types.split(',')
+        # Deduplicate the requested seat types so the IN clause below stays minimal.
+        seat_types = frozenset(seat_types.split(','))
 
         try:
             response = get_catalog_course_runs(
@@ -76,12 +77,14 @@ class CatalogViewSet(NestedViewSetMixin, ReadOnlyModelViewSet):
             )
             results = response['results']
             course_ids = [result['key'] for result in results]
+            # Iterate the queryset in chunks so large catalogs do not hold
+            # every matched product in memory at once during serialization.
             seats = serializers.ProductSerializer(
                 Product.objects.filter(
                     course_id__in=course_ids,
                     attributes__name='certificate_type',
                     attribute_values__value_text__in=seat_types
-                ),
+                ).iterator(chunk_size=500),
                 many=True,
                 context={'request': request}
             ).data
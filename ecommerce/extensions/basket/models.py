@@ -110,6 +110,24 @@ class Basket(AbstractBasket):
             track_segment_event(self.site, self.owner, 'Product Added', properties)
         return line, created
 
+    def all_lines(self):
+        """
+        Return a cached queryset of the basket lines.
+
+        Extends Oscar's select_related set (product, stockrecord) with the
+        product class relations so offer conditions that resolve a child
+        product's class through its parent do not issue a query per line.
+        """
+        if self.id is None:
+            return self.lines.none()
+        if self._lines is None:
+            self._lines = (
+                self.lines
+                .select_related('product__product_class', 'product__parent__product_class', 'stockrecord')
+                .prefetch_related('attributes', 'product__images')
+            )
+        return self._lines
+
     def clear_vouchers(self):
         """Remove all vouchers applied to the basket."""
         for v in self.vouchers.all():
@@ -6,6 +6,7 @@ import waffle
 from django.dispatch import receiver
 from oscar.core.loading import get_class, get_model
 
+from ecommerce.core.constants import COUPON_PRODUCT_CLASS_NAME
 from ecommerce.courses.utils import mode_for_product
 from ecommerce.extensions.analytics.utils import silence_exceptions, track_segment_event
 from ecommerce.extensions.basket.constants import ENABLE_STRIPE_PAYMENT_PROCESSOR
@@ -34,8 +35,36 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
     if order.total_excl_tax <= 0:
         return
 
+    # Coupon purchases are not tracked; let the database answer the check
+    # with a single EXISTS query before any lines are hydrated.
+    if order.lines.filter(product__product_class__name=COUPON_PRODUCT_CLASS_NAME).exists():
+        return
+
+    # Materialize the lines once, pulling in the related product data used
+    # below, so the loops here do not re-query per line. Child products
+    # resolve their class through the parent, so pull that relation in too.
+    lines = list(
+        order.lines.select_related(
+            'product__product_class', 'product__parent__product_class', 'product__course'
+        ).all()
+    )
+
+    product_class_names = {}
+
+    def product_class_name(product):
+        """ Resolve the product class name once per distinct class. """
+        # Namespace the key: product_class_id and parent_id are PKs of
+        # different models, so their raw values can collide.
+        if product.product_class_id:
+            key = ('class', product.product_class_id)
+        else:
+            key = ('parent', product.parent_id)
+        if key not in product_class_names:
+            product_class_names[key] = product.get_product_class().name
+        return product_class_names[key]
+
     products = []
-    for line in order.lines.all():
+    for line in lines:
         order_line = {
             # For backwards-compatibility with older events the `sku` field is (ab)used to
             # store the product's `certificate_type`, while the `id` field holds the product's
@@ -46,7 +75,7 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
             'name': line.product.course.id if line.product.course else line.product.title,
             'price': float(line.line_price_excl_tax),
             'quantity': int(line.quantity),
-            'category': line.product.get_product_class().name,
+            'category': product_class_name(line.product),
             # TODO: DENG-797: remove the the `title` once we are no longer forwarding
             # these events to Hubspot.
             'title': line.product.title,
@@ -72,14 +101,10 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
     if order.user:
         properties['email'] = order.user.email
 
-    for line in order.lines.all():
-        if line.product.is_enrollment_code_product:
-            # Send analytics events to track bulk enrollment code purchases.
-            track_segment_event(order.site, order.user, 'Bulk Enrollment Codes Order Completed', properties)
-            return
-
-        if line.product.is_coupon_product:
-            return
+    if any(line.product.is_enrollment_code_product for line in lines):
+        # Send analytics events to track bulk enrollment code purchases.
+        track_segment_event(order.site, order.user, 'Bulk Enrollment Codes Order Completed', properties)
+        return
 
     voucher = order.basket_discounts.filter(voucher_id__isnull=False).first()
     coupon = voucher.voucher_code if voucher else None
@@ -88,14 +113,14 @@ def track_completed_order(sender, order=None, **kwargs):  # pylint: disable=unus
     try:
         bundle_id = BasketAttribute.objects.get(basket=order.basket, attribute_type__name=BUNDLE).value_text
         program = get_program(bundle_id, order.basket.site.siteconfiguration)
-        if len(order.lines.all()) < len(program.get('courses')):
+        if len(lines) < len(program.get('courses')):
             variant = 'partial'
         else:
             variant = 'full'
         bundle_product = {
             'id': bundle_id,
             'price': 0,
-            'quantity': len(order.lines.all()),
+            'quantity': len(lines),
             'category': 'bundle',
             'variant': variant,
             'name': program.get('title')
@@ -118,11 +143,11 @@ def send_course_purchase_email(sender, order=None, request=None, **kwargs):  # p
     Send seat purchase notification email
     """
     if waffle.switch_is_active('ENABLE_NOTIFICATIONS'):
-        if len(order.lines.all()) != ORDER_LINE_COUNT:
+        if order.lines.count() != ORDER_LINE_COUNT:
             logger.info('Currently support receipt emails for order with one item.')
             return
 
-        product = order.lines.first().product
+        product = order.lines.select_related('product').first().product
         if product.is_seat_product or product.is_course_entitlement_product:
             recipient = request.POST.get('req_bill_to_email', order.user.email) if request else order.user.email
             receipt_page_url = get_receipt_page_url(
@@ -8,31 +8,51 @@ from babel.numbers import format_currency as default_format_currency
 from django.conf import settings
 from django.urls import reverse
 from django.utils.translation import get_language, to_locale
+from edx_django_utils.cache import TieredCache
 from requests.exceptions import ConnectionError as ReqConnectionError
 from requests.exceptions import HTTPError, Timeout
 
+from ecommerce.core.utils import get_cache_key
+
 logger = logging.getLogger(__name__)
 
 
 def get_credit_provider_details(credit_provider_id, site_configuration):
     """ Returns the credit provider details from LMS.
 
+    Provider details change rarely, so successful responses are cached per
+    site to keep this remote call off the post-checkout hot path. Failures
+    are not cached.
+
     Args:
         credit_provider_id (str): Identifier for the provider
         site_configuration (SiteConfiguration): Ecommerce Site Configuration
 
     Returns: dict
     """
+    cache_key = get_cache_key(
+        site_domain=site_configuration.site.domain,
+        resource='credit_provider',
+        provider_id=credit_provider_id
+    )
+    provider_data_cache_response = TieredCache.get_cached_response(cache_key)
+    if provider_data_cache_response.is_found:
+        return provider_data_cache_response.value
+
     try:
         client = site_configuration.oauth_api_client
         providers_url = parse.urljoin(f"{site_configuration.credit_api_url}/", f"providers/{credit_provider_id}/")
         response = client.get(providers_url)
         response.raise_for_status()
-        return response.json()
+        provider_data = response.json()
     except (ReqConnectionError, HTTPError, Timeout):
         logger.exception('Failed to retrieve credit provider details for provider [%s].', credit_provider_id)
         return None
 
+    if provider_data:
+        TieredCache.set_all_tiers(cache_key, provider_data, settings.CREDIT_PROVIDER_CACHE_TIMEOUT)
+    return provider_data
+
 
 def _use_microfrontend_receipt(request):
     """
@@ -9,6 +9,7 @@ from django.core.exceptions import ObjectDoesNotExist
 from django.db import transaction
 from django.http import JsonResponse
 from django.utils.decorators import method_decorator
+from django.utils.functional import cached_property
 from django.utils.html import escape
 from django.utils.translation import ugettext as _
 from edx_django_utils import monitoring as monitoring_utils
@@ -134,22 +135,30 @@ class MobileBasketAddItemsView(BasketLogicMixin, APIView):
 
     def _get_products(self, request, skus):
         partner = get_partner_for_site(request)
-        products = Product.objects.filter(stockrecords__partner=partner, stockrecords__partner_sku__in=skus)
+        # Materialize once so the emptiness check and the downstream
+        # availability loop share a single evaluation of the queryset.
+        products = list(
+            Product.objects.filter(
+                stockrecords__partner=partner, stockrecords__partner_sku__in=skus
+            ).select_related('product_class').prefetch_related('stockrecords', 'attribute_values__attribute').distinct()
+        )
         if not products:
             raise BadRequestException(_(PRODUCTS_DO_NOT_EXIST).format(skus=', '.join(skus)))
 
         return products
 
     def _get_available_products(self, request, products):
-        unavailable_product_ids = []
-
+        # _get_products hands over a materialized, prefetched list; the
+        # strategy reads stock records through the prefetch cache, so this
+        # loop issues no queries.
+        available_products = []
         for product in products:
             purchase_info = request.strategy.fetch_for_product(product)
-            if not purchase_info.availability.is_available_to_buy:
+            if purchase_info.availability.is_available_to_buy:
+                available_products.append(product)
+            else:
                 logger.warning(PRODUCT_IS_NOT_AVAILABLE, product.title)
-                unavailable_product_ids.append(product.id)
 
-        available_products = products.exclude(id__in=unavailable_product_ids)
         if not available_products:
             raise BadRequestException(_(NO_PRODUCT_AVAILABLE))
 
@@ -174,8 +183,10 @@ class MobileCoursePurchaseExecutionView(EdxOrderPlacementMixin, APIView):
     """
     permission_classes = (IsAuthenticated,)
 
-    @property
+    @cached_property
     def payment_processor(self):
+        # A POST targets a single processor, so build it once per request
+        # rather than re-reading configuration on every access.
         if self.request.data['payment_processor'] == IOSIAP.NAME:
             return IOSIAP(self.request.site)
 
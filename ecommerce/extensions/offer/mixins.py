@@ -1,7 +1,5 @@
 
 
-import operator
-
 from oscar.core.loading import get_model
 
 Benefit = get_model('offer', 'Benefit')
@@ -16,13 +14,12 @@ class BenefitWithoutRangeMixin:
     """
     def get_applicable_lines(self, offer, basket, range=None):  # pylint: disable=unused-argument,redefined-builtin
         condition = offer.condition.proxy() or offer.condition
+        # Lines are requested cheapest first to ensure consistent applications;
+        # filtering below preserves that order, so no further sort is needed.
         line_tuples = condition.get_applicable_lines(offer, basket, most_expensive_first=False)
 
         # Do not allow multiple discounts per line
-        line_tuples = [line_tuple for line_tuple in line_tuples if line_tuple[1].quantity_without_discount > 0]
-
-        # We sort lines to be cheapest first to ensure consistent applications
-        return sorted(line_tuples, key=operator.itemgetter(0))
+        return [line_tuple for line_tuple in line_tuples if line_tuple[1].quantity_without_discount > 0]
 
 
 class ConditionWithoutRangeMixin:
@@ -29,8 +29,8 @@ from oscar.core.loading import get_model
 from requests.exceptions import ConnectionError as ReqConnectionError
 from requests.exceptions import RequestException, Timeout
 from simple_history.models import HistoricalRecords
-from threadlocals.threadlocals import get_current_request
 
+from ecommerce.core.request_context import get_current_request
 from ecommerce.core.utils import get_cache_key, log_message_and_raise_validation_error
 from ecommerce.extensions.offer.constants import (
     EMAIL_TEMPLATE_TYPES,
@@ -551,7 +551,7 @@ class Range(AbstractRange):
 
         elif self.catalog:
             contains_product = (
-                product.id in self.catalog.stock_records.values_list('product', flat=True) or contains_product
+                contains_product or self.catalog.stock_records.filter(product_id=product.id).exists()
             )
 
         if not contains_product:
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('payment', '0033_auto_20231108_1355'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='paymentprocessorresponse',
+            index=models.Index(fields=['basket', 'created'], name='payment_ppr_basket_created_idx'),
+        ),
+    ]
@@ -33,6 +33,11 @@ class PaymentProcessorResponse(models.Model):
     class Meta:
         get_latest_by = 'created'
         index_together = ('processor_name', 'transaction_id')
+        indexes = [
+            # Supports audit/reconciliation queries that scan a basket's
+            # processor responses chronologically.
+            models.Index(fields=['basket', 'created'], name='payment_ppr_basket_created_idx'),
+        ]
         verbose_name = _('Payment Processor Response')
         verbose_name_plural = _('Payment Processor Responses')
 
@@ -105,15 +110,19 @@ class EnterpriseContractMetadata(TimeStampedModel):
                 self._validate_percentage_value()
 
     def _validate_fixed_value(self):
-        before_decimal, __, after_decimal = str(self.discount_value).partition('.')
+        # Inspect the Decimal tuple directly rather than parsing str(value),
+        # which renders scientific notation for some inputs (e.g. 1E+2).
+        digits, exponent = Decimal(self.discount_value).as_tuple()[1:]
+        before_decimal_count = max(len(digits) + exponent, 1)
+        after_decimal_count = max(-exponent, 0)
 
-        if len(before_decimal) > 10:
+        if before_decimal_count > 10:
             raise ValidationError(_(
                 "More than 10 digits before the decimal "
                 "not allowed for fixed value."
             ))
 
-        if len(after_decimal) > 2:
+        if after_decimal_count > 2:
             raise ValidationError(_(
                 "More than 2 digits after the decimal "
                 "not allowed for fixed value."
@@ -206,7 +215,7 @@ class SDNFallbackMetadata(TimeStampedModel):
         # (e.g. when the first file is added + just swapped).
         # If there are 2 rows in the table, after the swaps, we expect to have one row in
         # the 'Current' status and one row in the 'Discard' status.
-        if len(SDNFallbackMetadata.objects.all()) >= 1:
+        if SDNFallbackMetadata.objects.exists():
             try:
                 SDNFallbackMetadata.objects.get(import_state='Current')
             except SDNFallbackMetadata.DoesNotExist:
@@ -222,18 +231,15 @@ class SDNFallbackMetadata(TimeStampedModel):
         Rows in this table should progress from New -> Current -> Discard -> (row deleted).
         There can be at most one row in each import_state at a given time.
         """
-        try:
-            existing_metadata = SDNFallbackMetadata.objects.get(import_state=import_state)
-            if import_state == 'Discard':
-                existing_metadata.delete()
-            else:
-                if import_state == 'New':
-                    existing_metadata.import_state = 'Current'
-                elif import_state == 'Current':
-                    existing_metadata.import_state = 'Discard'
-                existing_metadata.full_clean()
-                existing_metadata.save()
-        except SDNFallbackMetadata.DoesNotExist:
+        rows = SDNFallbackMetadata.objects.filter(import_state=import_state)
+        if import_state == 'Discard':
+            changed = rows.delete()[0]
+        else:
+            next_state = 'Current' if import_state == 'New' else 'Discard'
+            # A single UPDATE; the unique constraint on import_state still
+            # guards against duplicate states within the transaction.
+            changed = rows.update(import_state=next_state)
+        if not changed:
             logger.info(
                 "SDNFallback: Cannot update import_state of %s row if there is no row in this state.",
                 import_state
@@ -1,13 +1,24 @@
 
 
 import logging
+import time
 from urllib.parse import urljoin
 
 from django.conf import settings
+from django.core.cache import cache
 from edx_django_utils.cache import TieredCache
 
 logger = logging.getLogger(__name__)
 
+# How long a worker may hold the cache-refill lock for a program before
+# other workers stop deferring to it.
+PROGRAM_CACHE_LOCK_TIMEOUT = 5
+
+# How often, and how many times, a worker that lost the lock race re-reads
+# the cache before giving up and fetching directly.
+PROGRAM_CACHE_LOCK_RETRY_DELAY = 0.2
+PROGRAM_CACHE_LOCK_RETRIES = 5
+
 
 class ProgramsApiClient:
     """ Client for the Programs API.
@@ -41,12 +52,32 @@ class ProgramsApiClient:
             logger.debug('Program [%s] was found in the cache.', program_uuid)
             return program_cached_response.value
 
+        # On a cache miss, take a short-lived lock so a single worker refills
+        # the cache. Workers that lose the race wait briefly for the owner to
+        # finish, re-reading the cache, and only fetch directly themselves if
+        # the refill still has not landed (e.g. the owner crashed).
+        lock_key = '{cache_key}-lock'.format(cache_key=cache_key)
+        lock_acquired = cache.add(lock_key, 1, PROGRAM_CACHE_LOCK_TIMEOUT)
+        if not lock_acquired:
+            for __ in range(PROGRAM_CACHE_LOCK_RETRIES):
+                time.sleep(PROGRAM_CACHE_LOCK_RETRY_DELAY)
+                program_cached_response = TieredCache.get_cached_response(cache_key)
+                if program_cached_response.is_found:
+                    return program_cached_response.value
+
         logging.info('Retrieving details of program [%s]...', program_uuid)
-        api_url = urljoin(f"{self.api_url}/", f"programs/{program_uuid}/")
-        resp = self.client.get(api_url)
-        resp.raise_for_status()
-        program = resp.json()
+        try:
+            api_url = urljoin(f"{self.api_url}/", f"programs/{program_uuid}/")
+            resp = self.client.get(api_url)
+            resp.raise_for_status()
+            program = resp.json()
+
+            TieredCache.set_all_tiers(cache_key, program, self.cache_ttl)
+        finally:
+            # Only the owner may release the lock; deleting it from a loser
+            # would let further workers through while the owner still works.
+            if lock_acquired:
+                cache.delete(lock_key)
 
-        TieredCache.set_all_tiers(cache_key, program, self.cache_ttl)
         logging.info('Program [%s] was successfully retrieved and cached.', program_uuid)
         return program
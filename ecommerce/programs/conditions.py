@@ -28,22 +28,46 @@ class ProgramCourseRunSeatsCondition(SingleItemConsumptionConditionMixin, Condit
     def name(self):
         return 'Basket contains a seat for every course in program {}'.format(self.program_uuid)
 
-    def _get_applicable_skus(self, site_configuration):
-        """ SKUs to which this condition applies. """
-        program_skus = set()
-        program = get_program(self.program_uuid, site_configuration)
-        if program:
-            applicable_seat_types = program['applicable_seat_types']
+    # Per-instance caches. Condition instances live for a single offer
+    # application pass, during which can_apply_condition is invoked once per
+    # basket line, so memoizing here collapses the repeated program walks.
+    _applicable_skus = None
+    _course_sku_sets = None
+
+    def _program_sku_index(self, program):
+        """ Return the set of applicable SKUs for each course in the program.
 
+        The sets are built once per condition instance and returned as a list
+        of frozensets aligned with ``program['courses']``.
+        """
+        if self._course_sku_sets is None:
+            applicable_seat_types = program['applicable_seat_types']
+            course_sku_sets = []
             for course in program['courses']:
-                for course_run in course['course_runs']:
-                    program_skus.update(
-                        {seat['sku'] for seat in course_run['seats'] if seat['type'] in applicable_seat_types}
-                    )
-                for entitlement in course['entitlements']:
-                    if entitlement['mode'].lower() in applicable_seat_types:
-                        program_skus.add(entitlement['sku'])
-        return program_skus
+                skus = {
+                    seat['sku']
+                    for course_run in course['course_runs']
+                    for seat in course_run['seats'] if seat['type'] in applicable_seat_types
+                }
+                skus.update(
+                    entitlement['sku']
+                    for entitlement in course['entitlements']
+                    if entitlement['mode'].lower() in applicable_seat_types
+                )
+                course_sku_sets.append(frozenset(skus))
+            self._course_sku_sets = course_sku_sets
+        return self._course_sku_sets
+
+    def _get_applicable_skus(self, site_configuration):
+        """ SKUs to which this condition applies. """
+        if self._applicable_skus is None:
+            program_skus = set()
+            program = get_program(self.program_uuid, site_configuration)
+            if program:
+                for course_skus in self._program_sku_index(program):
+                    program_skus.update(course_skus)
+            self._applicable_skus = frozenset(program_skus)
+        return self._applicable_skus
 
     def _get_lms_resource_for_user(self, basket, resource_name, client, endpoint):
         cache_key = get_cache_key(
@@ -69,7 +93,15 @@ class ProgramCourseRunSeatsCondition(SingleItemConsumptionConditionMixin, Condit
     def _get_lms_resource(self, basket, resource_name, client, endpoint):
         if not basket.owner:
             return []
-        return self._get_lms_resource_for_user(basket, resource_name, client, endpoint)
+        # Multiple program offers evaluate their conditions against the same
+        # basket during a single Applicator pass. Memoize the response on the
+        # basket so each resource is only fetched once per pass.
+        cache_attr = '_cached_{}'.format(resource_name)
+        data_list = getattr(basket, cache_attr, None)
+        if data_list is None:
+            data_list = self._get_lms_resource_for_user(basket, resource_name, client, endpoint)
+            setattr(basket, cache_attr, data_list)
+        return data_list
 
     def _get_user_ownership_data(self, basket, retrieve_entitlements=False):
         """
@@ -132,13 +164,26 @@ class ProgramCourseRunSeatsCondition(SingleItemConsumptionConditionMixin, Condit
         retrieve_entitlements = self._has_entitlements(program)
         enrollments, entitlements = self._get_user_ownership_data(basket, retrieve_entitlements)
 
-        for course in program['courses']:
+        # Index the user's enrollments and entitlements up front so the course
+        # loop below performs set lookups rather than rescanning both lists
+        # for every course in the program.
+        enrolled_course_run_ids = {
+            enrollment['course_details']['course_id']
+            for enrollment in enrollments
+            if enrollment['mode'] in applicable_seat_types
+        }
+        entitled_course_uuids = {
+            entitlement['course_uuid']
+            for entitlement in entitlements
+            if entitlement['mode'] in applicable_seat_types
+        }
+
+        course_sku_sets = self._program_sku_index(program)
+        for course, skus in zip(program['courses'], course_sku_sets):
             # If the user is already enrolled in a course, we do not need to check their basket for it
-            if any(enrollment['course_details']['course_id'] in [run['key'] for run in course['course_runs']] and
-                   enrollment['mode'] in applicable_seat_types for enrollment in enrollments):
+            if any(run['key'] in enrolled_course_run_ids for run in course['course_runs']):
                 continue
-            if any(course['uuid'] == entitlement['course_uuid'] and
-                   entitlement['mode'] in applicable_seat_types for entitlement in entitlements):
+            if course['uuid'] in entitled_course_uuids:
                 continue
 
             # If the  basket has no SKUs left, but we still have courses over which
@@ -146,26 +191,16 @@ class ProgramCourseRunSeatsCondition(SingleItemConsumptionConditionMixin, Condit
             if not basket_skus:
                 return False
 
-            # Get all of the SKUs that can satisfy this course
-            skus = set()
-            for course_run in course['course_runs']:
-                skus.update({seat['sku'] for seat in course_run['seats'] if seat['type'] in applicable_seat_types})
-            for entitlement in course['entitlements']:
-                if entitlement['mode'].lower() in applicable_seat_types:
-                    skus.add(entitlement['sku'])
-
-            # The lack of a difference in the set of SKUs in the basket and the course indicates that
-            # that there is no intersection. Therefore, the basket contains no SKUs for the current course.
-            # Because the user is also not enrolled in the course, it follows that the program condition is not met.
-            diff = basket_skus.difference(skus)
-            if diff == basket_skus:
+            # If the sets of SKUs in the basket and the course do not intersect, the basket contains no SKUs
+            # for the current course. Because the user is also not enrolled in the course, it follows that the
+            # program condition is not met. isdisjoint returns on the first collision without allocating a set.
+            if basket_skus.isdisjoint(skus):
                 return False
 
-            # If there is a difference between the basket SKUs and course SKUs, it represents the basket SKUs
-            # minus the SKUs for the current course. Since we have already verified the course is represented,
-            # its SKUs can be safely removed from the set of SKUs in the basket being checked. Note that this
-            # does NOT affect the actual basket, just our copy of its SKUs.
-            basket_skus = diff
+            # Since we have already verified the course is represented, its SKUs can be safely removed from
+            # the set of SKUs in the basket being checked. Note that this does NOT affect the actual basket,
+            # just our copy of its SKUs.
+            basket_skus = basket_skus - skus
 
         return True
 
@@ -27,10 +27,10 @@ from oscar.core.loading import get_class, get_model
 from oscar.test import factories
 from oscar.test.utils import RequestFactory
 from social_django.models import UserSocialAuth
-from threadlocals.threadlocals import set_thread_variable
 from waffle.models import Flag
 
 from ecommerce.core.constants import ALL_ACCESS_CONTEXT, SYSTEM_ENTERPRISE_ADMIN_ROLE, SYSTEM_ENTERPRISE_OPERATOR_ROLE
+from ecommerce.core.request_context import set_current_request as set_context_request
 from ecommerce.core.url_utils import get_lms_url
 from ecommerce.courses.models import Course
 from ecommerce.courses.utils import mode_for_product
@@ -369,7 +369,8 @@ class SiteMixin:
         self.request = RequestFactory(SERVER_NAME=domain).get('')
         self.request.session = None
         self.request.site = self.site
-        set_thread_variable('request', self.request)
+        set_context_request(self.request)
+        self.addCleanup(set_context_request)
         set_current_request(self.request)
         self.addCleanup(set_current_request)
 
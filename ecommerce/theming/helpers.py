@@ -9,7 +9,8 @@ import os
 import waffle
 from django.conf import ImproperlyConfigured, settings
 from path import Path
-from threadlocals.threadlocals import get_current_request
+
+from ecommerce.core.request_context import get_current_request
 
 logger = logging.getLogger(__name__)
 
@@ -4,8 +4,8 @@ Theming aware template loaders.
 
 
 from django.template.loaders.filesystem import Loader
-from threadlocals.threadlocals import get_current_request
 
+from ecommerce.core.request_context import get_current_request
 from ecommerce.theming.helpers import get_all_theme_template_dirs, get_current_theme
 
 